@@ -0,0 +1,590 @@
+"""Load test for the embedded web UI.
+
+Drives ``/api/state`` and ``/api/write`` with many concurrent keep-alive
+clients and reports throughput, tail latency and the CPU/RSS of the server
+process. The server runs in a subprocess so the client threads do not skew
+its CPU figures.
+
+With ``--serial-sim`` a pseudo terminal stands in for the USB adapter: the
+``ModbusSlave`` serves RTU on the pty while a separate process plays the
+Delta DVP master and times every request. Service time is measured once
+without web traffic and once under web load, so the report shows how much
+the HTTP layer inflates Modbus latency.
+
+    python -m benchmarks.web_load --slave dummy modbus \\
+        --data-points 128 5000 --concurrency 1 16 64 --duration 10 --serial-sim
+"""
+
+from __future__ import annotations
+
+import argparse
+import http.client
+import json
+import logging
+import multiprocessing
+import os
+import random
+import select
+import struct
+import subprocess
+import sys
+import threading
+import time
+import tty
+from dataclasses import asdict, dataclass, field
+from typing import Any, Sequence
+
+from sbc_vpc.config import TABLES
+
+
+class InMemorySlave:
+    """Slave stand-in without pymodbus, isolating the HTTP layer cost."""
+
+    def __init__(self, data_points: int = 128, unit_id: int = 1) -> None:
+        self.data_points = data_points
+        self.unit_id = unit_id
+        self._state = {name: [0] * data_points for name in TABLES}
+
+    @property
+    def tables(self) -> tuple[str, ...]:
+        return TABLES
+
+    def snapshot(
+        self,
+        start: int = 0,
+        count: int | None = None,
+        tables: Sequence[str] | None = None,
+    ) -> dict[str, list[int]]:
+        stop = self.data_points if count is None else start + count
+        names = self._state if tables is None else tables
+        return {name: self._state[name][start:stop] for name in names}
+
+    def write_table(self, table: str, address: int, values: Sequence[int]) -> None:
+        if table not in self._state:
+            raise ValueError(f"Unknown table '{table}'")
+        if address < 0 or address + len(values) > self.data_points:
+            raise ValueError("Write exceeds configured data size")
+        self._state[table][address : address + len(values)] = list(values)
+
+    def serial_status(self) -> dict[str, object]:
+        return {
+            "port": "in-memory",
+            "connected": True,
+            "reconnects": 0,
+            "downtimeSeconds": 0.0,
+            "lastError": None,
+        }
+
+
+@dataclass(slots=True)
+class LatencySummary:
+    """Distribution of request latencies, in milliseconds."""
+
+    count: int = 0
+    errors: int = 0
+    p50: float = 0.0
+    p90: float = 0.0
+    p99: float = 0.0
+    p999: float = 0.0
+    max: float = 0.0
+
+    @classmethod
+    def from_samples(cls, samples: Sequence[float], errors: int = 0) -> LatencySummary:
+        if not samples:
+            return cls(errors=errors)
+        ordered = sorted(samples)
+        return cls(
+            count=len(ordered),
+            errors=errors,
+            p50=_percentile(ordered, 0.50) * 1000,
+            p90=_percentile(ordered, 0.90) * 1000,
+            p99=_percentile(ordered, 0.99) * 1000,
+            p999=_percentile(ordered, 0.999) * 1000,
+            max=ordered[-1] * 1000,
+        )
+
+
+@dataclass(slots=True)
+class LoadResult:
+    """Outcome of one HTTP load run."""
+
+    duration: float
+    connections: int
+    endpoints: dict[str, LatencySummary] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        total = sum(summary.count for summary in self.endpoints.values())
+        return total / self.duration if self.duration else 0.0
+
+
+def _percentile(ordered: Sequence[float], fraction: float) -> float:
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _client_worker(
+    host: str,
+    port: int,
+    deadline: float,
+    write_ratio: float,
+    window: int,
+    data_points: int,
+    seed: int,
+    samples: dict[str, list[float]],
+    errors: dict[str, int],
+    connections: list[int],
+) -> None:
+    rng = random.Random(seed)
+    conn = http.client.HTTPConnection(host, port, timeout=10)
+    opened = 0
+    while time.perf_counter() < deadline:
+        if rng.random() < write_ratio:
+            endpoint = "/api/write"
+            body: bytes | None = json.dumps(
+                {
+                    "table": "holding_registers",
+                    "address": rng.randrange(data_points),
+                    "values": [rng.randrange(65536)],
+                }
+            ).encode("utf-8")
+            method, path = "POST", endpoint
+            headers = {"Content-Type": "application/json"}
+        else:
+            endpoint = "/api/state"
+            body, method, headers = None, "GET", {}
+            path = endpoint
+            if window > 0:
+                # Like the web UI: one request carrying every table's window.
+                path = endpoint + "?" + "&".join(
+                    f"{name}={rng.randrange(max(1, data_points - window + 1))}:{window}"
+                    for name in TABLES
+                )
+        if conn.sock is None:
+            opened += 1
+        started = time.perf_counter()
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            errors[endpoint] += 1
+            continue
+        elapsed = time.perf_counter() - started
+        if response.status == 200:
+            samples[endpoint].append(elapsed)
+        else:
+            errors[endpoint] += 1
+    conn.close()
+    connections.append(opened)
+
+
+def run_http_load(
+    host: str,
+    port: int,
+    *,
+    concurrency: int,
+    duration: float,
+    data_points: int,
+    write_ratio: float = 0.1,
+    window: int = 0,
+) -> LoadResult:
+    """Hammer the web API from ``concurrency`` keep-alive clients."""
+
+    endpoints = ("/api/state", "/api/write")
+    per_thread = [
+        ({name: [] for name in endpoints}, {name: 0 for name in endpoints})
+        for _ in range(concurrency)
+    ]
+    connections: list[int] = []
+    started = time.perf_counter()
+    deadline = started + duration
+    threads = [
+        threading.Thread(
+            target=_client_worker,
+            args=(
+                host,
+                port,
+                deadline,
+                write_ratio,
+                window,
+                data_points,
+                index,
+                samples,
+                errors,
+                connections,
+            ),
+            daemon=True,
+        )
+        for index, (samples, errors) in enumerate(per_thread)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    result = LoadResult(duration=elapsed, connections=sum(connections))
+    for name in endpoints:
+        merged = [value for samples, _ in per_thread for value in samples[name]]
+        failed = sum(errors[name] for _, errors in per_thread)
+        result.endpoints[name] = LatencySummary.from_samples(merged, failed)
+    return result
+
+
+def modbus_crc(frame: bytes) -> bytes:
+    """Return the little-endian Modbus RTU CRC16 of ``frame``."""
+
+    crc = 0xFFFF
+    for byte in frame:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return struct.pack("<H", crc)
+
+
+def _rtu_transaction(fd: int, request: bytes, timeout: float) -> bytes | None:
+    os.write(fd, request)
+    buffer = b""
+    expected = 5
+    deadline = time.perf_counter() + timeout
+    while len(buffer) < expected:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None
+        ready, _, _ = select.select([fd], [], [], remaining)
+        if not ready:
+            return None
+        buffer += os.read(fd, 512)
+        if len(buffer) >= 3 and not buffer[1] & 0x80:
+            expected = 5 + buffer[2]
+    return buffer
+
+
+def _serial_master(
+    fd: int,
+    unit_id: int,
+    data_points: int,
+    duration: float,
+    interval: float,
+    result_pipe: Any,
+) -> None:
+    """Play the Delta DVP: poll holding registers and time each reply."""
+
+    rng = random.Random(0)
+    count = max(1, min(16, data_points - 1))
+    warmup = time.perf_counter() + 10
+    probe = struct.pack(">BBHH", unit_id, 3, 0, 1)
+    while _rtu_transaction(fd, probe + modbus_crc(probe), 0.5) is None:
+        if time.perf_counter() > warmup:
+            result_pipe.send({"samples": [], "timeouts": -1})
+            return
+
+    samples: list[float] = []
+    timeouts = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        address = rng.randrange(max(1, data_points - count))
+        frame = struct.pack(">BBHH", unit_id, 3, address, count)
+        started = time.perf_counter()
+        if _rtu_transaction(fd, frame + modbus_crc(frame), 1.0) is None:
+            timeouts += 1
+        else:
+            samples.append(time.perf_counter() - started)
+        time.sleep(interval)
+    result_pipe.send({"samples": samples, "timeouts": timeouts})
+
+
+def run_serial_master(
+    fd: int,
+    *,
+    unit_id: int,
+    data_points: int,
+    duration: float,
+    interval: float = 0.01,
+) -> tuple[multiprocessing.Process, Any]:
+    """Start the DVP simulator in its own process (shares no GIL with us)."""
+
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_serial_master,
+        args=(fd, unit_id, data_points, duration, interval, sender),
+        daemon=True,
+    )
+    process.start()
+    return process, receiver
+
+
+def _collect_serial(process: multiprocessing.Process, receiver: Any) -> LatencySummary:
+    payload = receiver.recv()
+    process.join()
+    if payload["timeouts"] < 0:
+        raise RuntimeError("Serial simulator got no reply from the Modbus slave")
+    return LatencySummary.from_samples(payload["samples"], payload["timeouts"])
+
+
+class ServerProcess:
+    """Runs :class:`WebUIServer` in a subprocess and samples its usage."""
+
+    def __init__(self, slave: str, data_points: int, port: str | None) -> None:
+        command = [
+            sys.executable,
+            "-m",
+            "benchmarks.web_load",
+            "serve",
+            "--slave",
+            slave,
+            "--data-points",
+            str(data_points),
+        ]
+        if port:
+            command += ["--port", port]
+        self._process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True
+        )
+        line = self._process.stdout.readline()  # type: ignore[union-attr]
+        if not line:
+            self.close()
+            raise RuntimeError("Benchmark server failed to start")
+        self.port = int(json.loads(line)["port"])
+
+    def __enter__(self) -> ServerProcess:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def cpu_seconds(self) -> float | None:
+        try:
+            with open(f"/proc/{self._process.pid}/stat") as handle:
+                fields = handle.read().rsplit(")", 1)[1].split()
+        except OSError:
+            return None
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+    def memory_mb(self) -> tuple[float, float] | None:
+        """Current and peak resident set size."""
+
+        values: dict[str, float] = {}
+        try:
+            with open(f"/proc/{self._process.pid}/status") as handle:
+                for line in handle:
+                    key, _, rest = line.partition(":")
+                    if key in {"VmRSS", "VmHWM"}:
+                        values[key] = int(rest.split()[0]) / 1024
+        except OSError:
+            return None
+        return values.get("VmRSS", 0.0), values.get("VmHWM", 0.0)
+
+    def close(self) -> None:
+        if self._process.poll() is None:
+            self._process.stdin.close()  # type: ignore[union-attr]
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+                self._process.wait()
+
+
+def run_scenario(
+    slave: str,
+    data_points: int,
+    concurrency: int,
+    *,
+    duration: float,
+    write_ratio: float,
+    window: int,
+    serial_sim: bool,
+) -> dict[str, Any]:
+    """Run one load level against a fresh server and return its report."""
+
+    master_fd = slave_fd = None
+    port_name = None
+    if serial_sim and slave == "modbus":
+        master_fd, slave_fd = os.openpty()
+        tty.setraw(master_fd)
+        tty.setraw(slave_fd)
+        port_name = os.ttyname(slave_fd)
+    try:
+        with ServerProcess(slave, data_points, port_name) as server:
+            report: dict[str, Any] = {
+                "slave": slave,
+                "dataPoints": data_points,
+                "concurrency": concurrency,
+            }
+            if master_fd is not None:
+                idle = _collect_serial(
+                    *run_serial_master(
+                        master_fd,
+                        unit_id=1,
+                        data_points=data_points,
+                        duration=duration,
+                    )
+                )
+                report["modbusIdle"] = asdict(idle)
+                simulator = run_serial_master(
+                    master_fd,
+                    unit_id=1,
+                    data_points=data_points,
+                    duration=duration,
+                )
+            cpu_before = server.cpu_seconds()
+            load = run_http_load(
+                "127.0.0.1",
+                server.port,
+                concurrency=concurrency,
+                duration=duration,
+                data_points=data_points,
+                write_ratio=write_ratio,
+                window=window,
+            )
+            cpu_after = server.cpu_seconds()
+            if master_fd is not None:
+                report["modbusLoaded"] = asdict(_collect_serial(*simulator))
+            report["throughput"] = load.throughput
+            report["connections"] = load.connections
+            report["endpoints"] = {
+                name: asdict(summary) for name, summary in load.endpoints.items()
+            }
+            if cpu_before is not None and cpu_after is not None:
+                report["cpuPercent"] = 100 * (cpu_after - cpu_before) / load.duration
+            memory = server.memory_mb()
+            if memory is not None:
+                report["rssMb"], report["peakRssMb"] = memory
+            return report
+    finally:
+        for fd in (master_fd, slave_fd):
+            if fd is not None:
+                os.close(fd)
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Render a scenario report as a short human-readable block."""
+
+    lines = [
+        "{slave} data_points={dataPoints} concurrency={concurrency}: "
+        "{throughput:.0f} req/s over {connections} connection(s)".format(**report)
+    ]
+    if "cpuPercent" in report:
+        lines.append(
+            "  server cpu {cpuPercent:.0f}%  rss {rssMb:.1f} MB  "
+            "peak {peakRssMb:.1f} MB".format(**report)
+        )
+    for name, summary in report["endpoints"].items():
+        lines.append(
+            "  {name:<11} n={count:<7} err={errors:<4} p50={p50:.2f}ms "
+            "p99={p99:.2f}ms p99.9={p999:.2f}ms max={max:.2f}ms".format(
+                name=name, **summary
+            )
+        )
+    if "modbusIdle" in report:
+        idle, loaded = report["modbusIdle"], report["modbusLoaded"]
+        lines.append(
+            "  modbus      p50 {0:.2f} -> {1:.2f}ms  p99 {2:.2f} -> {3:.2f}ms  "
+            "timeouts {4} -> {5}".format(
+                idle["p50"],
+                loaded["p50"],
+                idle["p99"],
+                loaded["p99"],
+                idle["errors"],
+                loaded["errors"],
+            )
+        )
+    return "\n".join(lines)
+
+
+def _serve(argv: list[str]) -> int:
+    parser = argparse.ArgumentParser(prog="benchmarks.web_load serve")
+    parser.add_argument("--slave", choices=("dummy", "modbus"), default="dummy")
+    parser.add_argument("--data-points", type=int, default=128)
+    parser.add_argument("--port", help="Serial port served by the Modbus slave")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level)
+
+    from sbc_vpc.web import WebUIServer
+
+    slave: Any
+    if args.slave == "dummy":
+        slave = InMemorySlave(args.data_points)
+    else:
+        from sbc_vpc.config import SerialConnectionConfig
+        from sbc_vpc.modbus import DeltaRequestLogger, ModbusSlave
+
+        slave = ModbusSlave(
+            config=SerialConnectionConfig(port=args.port or "", baudrate=115200),
+            request_logger=DeltaRequestLogger(),
+            data_points=args.data_points,
+        )
+        if args.port:
+            threading.Thread(target=slave.serve_forever, daemon=True).start()
+
+    server = WebUIServer(slave=slave, host="127.0.0.1", port=0)
+    server.start_in_thread()
+    print(json.dumps({"port": server.server_address[1]}), flush=True)
+    sys.stdin.read()
+    server.shutdown()
+    return 0
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Load-test the web UI API and report latency and usage.",
+    )
+    parser.add_argument(
+        "--slave", nargs="+", choices=("dummy", "modbus"), default=["dummy", "modbus"]
+    )
+    parser.add_argument("--data-points", nargs="+", type=int, default=[128, 5000])
+    parser.add_argument("--concurrency", nargs="+", type=int, default=[1, 16, 64])
+    parser.add_argument(
+        "--duration", type=float, default=5.0, help="Seconds per measurement"
+    )
+    parser.add_argument(
+        "--write-ratio", type=float, default=0.1, help="Share of /api/write calls"
+    )
+    parser.add_argument(
+        "--window",
+        type=int,
+        default=0,
+        help="Request only this many points per /api/state call (0 = full tables)",
+    )
+    parser.add_argument(
+        "--serial-sim",
+        action="store_true",
+        help="Serve RTU on a pty and measure Modbus service time under web load",
+    )
+    parser.add_argument("--json", metavar="PATH", help="Also write reports as JSON")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        return _serve(argv[1:])
+    args = build_arg_parser().parse_args(argv)
+
+    reports = []
+    for slave in args.slave:
+        for data_points in args.data_points:
+            for concurrency in args.concurrency:
+                report = run_scenario(
+                    slave,
+                    data_points,
+                    concurrency,
+                    duration=args.duration,
+                    write_ratio=args.write_ratio,
+                    window=args.window,
+                    serial_sim=args.serial_sim,
+                )
+                print(format_report(report), flush=True)
+                reports.append(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as handle:
+            json.dump(reports, handle, indent=2)
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI entrypoint
+    raise SystemExit(main())
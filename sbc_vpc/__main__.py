@@ -3,35 +3,140 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import signal
 import threading
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
-from .config import SerialConnectionConfig
+from .config import (
+    BYTESIZES,
+    PARITIES,
+    RELOADABLE_KEYS,
+    STOPBITS,
+    TABLES,
+    SerialConnectionConfig,
+    load_config_file,
+)
 
 if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
     from .modbus import DeltaRequestLogger, ModbusSlave
 
-try:  # pragma: no cover - serial might be optional during tests
-    from serial import SerialException  # type: ignore[attr-defined]
-except Exception:  # pragma: no cover - fallback when pyserial absent at runtime
-    SerialException = OSError  # type: ignore[assignment]
+def parse_address_range(value: str) -> tuple[int, int]:
+    """Parse an inclusive ``START-END`` (or single ``ADDR``) address range."""
+
+    start_raw, sep, end_raw = value.partition("-")
+    try:
+        start = int(start_raw)
+        end = int(end_raw) if sep else start
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid address range '{value}' (expected START-END)"
+        ) from None
+    if start < 0 or end < start:
+        raise argparse.ArgumentTypeError(
+            f"invalid address range '{value}' (expected 0 <= START <= END)"
+        )
+    return start, end
+
+
+def explicit_settings(argv: list[str] | None) -> frozenset[str]:
+    """Return the reloadable settings given explicitly on the command line."""
+
+    unset = object()
+    probe = build_arg_parser()
+    probe.set_defaults(**{key: unset for key in RELOADABLE_KEYS})
+    given = vars(probe.parse_args(argv))
+    return frozenset(key for key in RELOADABLE_KEYS if given[key] is not unset)
+
+
+def serial_config_from_args(args: argparse.Namespace) -> SerialConnectionConfig:
+    """Build the serial connection settings from parsed options."""
+
+    return SerialConnectionConfig(
+        port=args.port,
+        baudrate=args.baudrate,
+        bytesize=args.bytesize,
+        parity=args.parity,
+        stopbits=args.stopbits,
+        timeout=args.timeout,
+    )
+
+
+def reload_settings(
+    slave: ModbusSlave, path: str, argv: list[str] | None = None
+) -> dict[str, object]:
+    """Re-read the ``--config`` file and apply it to a running slave.
+
+    Settings are rebuilt exactly as at startup: built-in defaults, then the
+    file, then options given explicitly in ``argv``. A key removed from the
+    file therefore falls back to its command-line or default value.
+    """
+
+    values = load_config_file(path)
+    ignored = sorted(explicit_settings(argv).intersection(values))
+    if ignored:
+        logging.getLogger(__name__).info(
+            "Keeping command-line values for %s", ", ".join(ignored)
+        )
+    parser = build_arg_parser()
+    parser.set_defaults(**values)
+    args = parser.parse_args(argv)
+    config = serial_config_from_args(args)
+    slave.reconfigure(
+        config=config,
+        data_points=args.data_points,
+        unit_id=args.unit_id,
+    )
+    return {
+        "dataPoints": slave.data_points,
+        "unitId": slave.unit_id,
+        "serial": config.as_dict(),
+    }
+
+
+def install_reload_signal(reload: Callable[[], object] | None) -> None:
+    """Run ``reload`` in a worker thread whenever SIGHUP arrives."""
+
+    if not hasattr(signal, "SIGHUP"):  # pragma: no cover - non-POSIX
+        return
+    logger = logging.getLogger(__name__)
+
+    def _reload() -> None:
+        if reload is None:
+            logger.warning("SIGHUP received but no --config file to reload")
+            return
+        try:
+            logger.info("Reloaded configuration: %s", reload())
+        except (OSError, ValueError) as exc:
+            logger.error("Failed to reload configuration: %s", exc)
+
+    def _on_sighup(signum: int, frame: object) -> None:
+        threading.Thread(target=_reload, name="config-reload", daemon=True).start()
+
+    signal.signal(signal.SIGHUP, _on_sighup)
 
 
 def build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run the Orange Pi Modbus slave to observe Delta DVP traffic.",
     )
+    parser.add_argument(
+        "--config",
+        metavar="PATH",
+        help="JSON file with port/line/data-points/unit-id settings, "
+        "re-read on SIGHUP or POST /api/reload",
+    )
     parser.add_argument("--port", default="/dev/ttyUSB0", help="Serial port name")
     parser.add_argument("--baudrate", type=int, default=9600, help="Serial baudrate")
     parser.add_argument(
-        "--bytesize", type=int, default=8, choices=(5, 6, 7, 8), help="Data bits"
+        "--bytesize", type=int, default=8, choices=BYTESIZES, help="Data bits"
     )
     parser.add_argument(
-        "--parity", default="N", choices=("N", "E", "O", "M", "S"), help="Parity"
+        "--parity", default="N", choices=PARITIES, help="Parity"
     )
     parser.add_argument(
-        "--stopbits", type=int, default=1, choices=(1, 2), help="Stop bits"
+        "--stopbits", type=int, default=1, choices=STOPBITS, help="Stop bits"
     )
     parser.add_argument(
         "--timeout", type=float, default=1.0, help="Serial read timeout in seconds"
@@ -45,6 +150,18 @@ def build_arg_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--unit-id", type=int, default=1, help="Modbus unit/slave id (1..247)"
     )
+    parser.add_argument(
+        "--reconnect-delay",
+        type=float,
+        default=0.1,
+        help="Initial delay before reopening a lost serial port, seconds",
+    )
+    parser.add_argument(
+        "--reconnect-delay-max",
+        type=float,
+        default=5.0,
+        help="Upper bound for the exponential reconnect backoff, seconds",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -67,6 +184,47 @@ def build_arg_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Отключить встроенный веб-интерфейс",
     )
+    parser.add_argument(
+        "--traffic-log",
+        metavar="PATH",
+        help="Писать запросы Delta в JSONL-файл вместо текстового лога",
+    )
+    parser.add_argument(
+        "--traffic-log-max-bytes",
+        type=int,
+        default=16 * 1024 * 1024,
+        help="Размер сегмента JSONL-лога перед ротацией, байт",
+    )
+    parser.add_argument(
+        "--traffic-log-rotate-seconds",
+        type=float,
+        default=None,
+        help="Ротировать JSONL-лог не реже, чем раз в N секунд",
+    )
+    parser.add_argument(
+        "--traffic-log-backups",
+        type=int,
+        default=10,
+        help="Сколько сжатых сегментов JSONL-лога хранить",
+    )
+    parser.add_argument(
+        "--traffic-log-tables",
+        nargs="+",
+        choices=TABLES,
+        help="Писать в JSONL-лог только указанные таблицы",
+    )
+    parser.add_argument(
+        "--traffic-log-addresses",
+        type=parse_address_range,
+        metavar="START-END",
+        help="Писать в JSONL-лог только запросы, затрагивающие диапазон адресов",
+    )
+    parser.add_argument(
+        "--traffic-log-ops",
+        nargs="+",
+        choices=("read", "write"),
+        help="Писать в JSONL-лог только чтения и/или записи",
+    )
     return parser
 
 
@@ -81,6 +239,14 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_arg_parser()
     args = parser.parse_args(argv)
 
+    if args.config:
+        # File values replace the built-in defaults; explicit options still win.
+        try:
+            parser.set_defaults(**load_config_file(args.config))
+        except (OSError, ValueError) as exc:
+            parser.error(f"--config: {exc}")
+        args = parser.parse_args(argv)
+
     if not (1 <= args.unit_id <= 247):
         parser.error("--unit-id must be in 1..247")
 
@@ -90,33 +256,87 @@ def main(argv: list[str] | None = None) -> int:
     if not (1 <= args.web_port <= 65535):
         parser.error("--web-port must be in 1..65535")
 
+    if not (0 < args.reconnect_delay <= args.reconnect_delay_max):
+        parser.error("--reconnect-delay must be in (0, --reconnect-delay-max]")
+
+    if not args.traffic_log and (
+        args.traffic_log_tables or args.traffic_log_addresses or args.traffic_log_ops
+    ):
+        parser.error(
+            "--traffic-log-tables/--traffic-log-addresses/--traffic-log-ops "
+            "require --traffic-log"
+        )
+
+    if args.traffic_log_backups < 1:
+        parser.error("--traffic-log-backups must be at least 1")
+
+    if args.traffic_log_max_bytes <= 0:
+        parser.error("--traffic-log-max-bytes must be positive")
+
+    rotate_seconds = args.traffic_log_rotate_seconds
+    if rotate_seconds is not None and rotate_seconds <= 0:
+        parser.error("--traffic-log-rotate-seconds must be positive")
+
     configure_logging(args.log_level)
 
-    config = SerialConnectionConfig(
-        port=args.port,
-        baudrate=args.baudrate,
-        bytesize=args.bytesize,
-        parity=args.parity,
-        stopbits=args.stopbits,
-        timeout=args.timeout,
-    )
+    config = serial_config_from_args(args)
 
     try:
-        from .modbus import DeltaRequestLogger, ModbusSlave
+        from .modbus import (
+            DeltaRequestLogger,
+            JsonlTrafficLogger,
+            ModbusSlave,
+            TrafficFilter,
+        )
     except ImportError as exc:  # pragma: no cover - optional dependency missing
         logging.getLogger(__name__).error(
             "Failed to import Modbus helpers (is pymodbus installed?): %s", exc
         )
         return 1
 
-    request_logger = DeltaRequestLogger()
+    request_logger: DeltaRequestLogger
+    if args.traffic_log:
+        address_min, address_max = args.traffic_log_addresses or (0, None)
+        try:
+            request_logger = JsonlTrafficLogger(
+                args.traffic_log,
+                max_bytes=args.traffic_log_max_bytes,
+                rotate_interval=args.traffic_log_rotate_seconds,
+                backup_count=args.traffic_log_backups,
+                traffic_filter=TrafficFilter(
+                    tables=(
+                        frozenset(args.traffic_log_tables)
+                        if args.traffic_log_tables
+                        else None
+                    ),
+                    operations=frozenset(args.traffic_log_ops or ("read", "write")),
+                    address_min=address_min,
+                    address_max=address_max,
+                ),
+            )
+        except OSError as exc:
+            logging.getLogger(__name__).error(
+                "Failed to open traffic log %s: %s", args.traffic_log, exc
+            )
+            return 1
+    else:
+        request_logger = DeltaRequestLogger()
     slave = ModbusSlave(
         config=config,
         request_logger=request_logger,
         data_points=args.data_points,
         unit_id=args.unit_id,
+        reconnect_delay=args.reconnect_delay,
+        reconnect_delay_max=args.reconnect_delay_max,
     )
 
+    reload = (
+        functools.partial(reload_settings, slave, args.config, argv)
+        if args.config
+        else None
+    )
+    install_reload_signal(reload)
+
     web_server = None
     web_thread: threading.Thread | None = None
     if not args.no_web:
@@ -132,6 +352,7 @@ def main(argv: list[str] | None = None) -> int:
                 slave=slave,
                 host=args.web_bind,
                 port=args.web_port,
+                reload=reload,
             )
         except OSError as exc:
             logging.getLogger(__name__).error(
@@ -148,19 +369,17 @@ def main(argv: list[str] | None = None) -> int:
     except KeyboardInterrupt:  # pragma: no cover - manual interruption
         logging.getLogger(__name__).info("Interrupted by user")
         return 0
-    except (SerialException, OSError) as exc:  # type: ignore[misc]
-        logging.getLogger(__name__).error(
-            "Failed to open serial port %s: %s", args.port, exc
-        )
-        return 1
     except Exception as exc:  # pragma: no cover - startup/runtime error
         logging.getLogger(__name__).error("Failed to run Modbus slave: %s", exc)
         return 1
     finally:
+        slave.stop()
         if web_server is not None:
             web_server.shutdown()
         if web_thread is not None:
             web_thread.join(timeout=1)
+        if isinstance(request_logger, JsonlTrafficLogger):
+            request_logger.close()
     return 0
 
 
@@ -2,8 +2,29 @@
 
 from __future__ import annotations
 
+import json
+import os
 from dataclasses import dataclass
 
+BYTESIZES = (5, 6, 7, 8)
+PARITIES = ("N", "E", "O", "M", "S")
+STOPBITS = (1, 2)
+
+# Modbus data tables served by the slave, in pymodbus context order.
+TABLES = ("discrete_inputs", "coils", "holding_registers", "input_registers")
+
+# Settings that may come from a ``--config`` file and be re-read on reload.
+RELOADABLE_KEYS: dict[str, type] = {
+    "port": str,
+    "baudrate": int,
+    "bytesize": int,
+    "parity": str,
+    "stopbits": int,
+    "timeout": float,
+    "data_points": int,
+    "unit_id": int,
+}
+
 
 @dataclass(slots=True)
 class SerialConnectionConfig:
@@ -27,3 +48,40 @@ class SerialConnectionConfig:
             "stopbits": self.stopbits,
             "timeout": self.timeout,
         }
+
+
+def load_config_file(path: str | os.PathLike[str]) -> dict[str, object]:
+    """Read a JSON settings file.
+
+    Keys are the long CLI option names (``data-points`` or ``data_points``);
+    only :data:`RELOADABLE_KEYS` are accepted. Raises :class:`ValueError`
+    for unknown keys or invalid values.
+    """
+
+    with open(path, encoding="utf-8") as handle:
+        try:
+            raw = json.load(handle)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"{path}: invalid JSON: {exc}") from None
+    if not isinstance(raw, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+
+    values: dict[str, object] = {}
+    for key, value in raw.items():
+        name = key.replace("-", "_")
+        expected = RELOADABLE_KEYS.get(name)
+        if expected is None:
+            raise ValueError(f"{path}: unknown setting '{key}'")
+        if expected is float and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        if not isinstance(value, expected) or isinstance(value, bool):
+            raise ValueError(f"{path}: '{key}' must be {expected.__name__}")
+        values[name] = value
+
+    if values.get("bytesize", BYTESIZES[-1]) not in BYTESIZES:
+        raise ValueError(f"{path}: 'bytesize' must be one of {BYTESIZES}")
+    if values.get("parity", PARITIES[0]) not in PARITIES:
+        raise ValueError(f"{path}: 'parity' must be one of {PARITIES}")
+    if values.get("stopbits", STOPBITS[0]) not in STOPBITS:
+        raise ValueError(f"{path}: 'stopbits' must be one of {STOPBITS}")
+    return values
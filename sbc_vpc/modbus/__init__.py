@@ -1,5 +1,11 @@
 """Utilities for the Modbus integration between the SBC and Delta DVP."""
 
 from .scanner import DeltaRequestLogger, ModbusSlave
+from .traffic import JsonlTrafficLogger, TrafficFilter
 
-__all__ = ["DeltaRequestLogger", "ModbusSlave"]
+__all__ = [
+    "DeltaRequestLogger",
+    "JsonlTrafficLogger",
+    "ModbusSlave",
+    "TrafficFilter",
+]
@@ -3,6 +3,10 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
+from contextlib import suppress
 from dataclasses import dataclass, field
 from typing import Iterable, Sequence
 
@@ -31,10 +35,18 @@ except Exception:  # pragma: no cover - version-specific import layout
         ModbusSequentialDataBlock = _SequentialBlock
 
 try:
-    from pymodbus.server import StartSerialServer
+    from pymodbus.server import ServerStop, StartSerialServer
 except Exception:  # pragma: no cover - fallback for pymodbus<3
     from pymodbus.server.sync import StartSerialServer  # type: ignore[attr-defined]
 
+    def ServerStop() -> None:  # type: ignore[misc]  # noqa: N802
+        """Legacy servers cannot be stopped from another thread."""
+
+try:  # pragma: no cover - internal registry of the running server
+    from pymodbus.server.async_io import _serverList
+except Exception:  # pragma: no cover - layout differs between releases
+    _serverList = None  # type: ignore[assignment]  # noqa: N816
+
 try:
     from pymodbus.device import ModbusDeviceIdentification
 except Exception:  # pragma: no cover - pymodbus>=3.6 relocated
@@ -46,10 +58,17 @@ try:
 except Exception:  # pragma: no cover - pymodbus>=3.6 renamed
     from pymodbus.framer.rtu import FramerRTU as ModbusRtuFramer  # type: ignore[attr-defined]
 
-from ..config import SerialConnectionConfig
+try:  # pragma: no cover - serial might be optional during tests
+    import serial  # type: ignore[import-untyped]
+except Exception:  # pragma: no cover - pyserial absent at runtime
+    serial = None  # type: ignore[assignment]
+
+from ..config import TABLES, SerialConnectionConfig
 
 _LOGGER = logging.getLogger(__name__)
 
+_OPEN_POLL_INTERVAL = 0.01
+
 
 class DeltaRequestLogger:
     """Helper that logs read and write operations initiated by Delta."""
@@ -91,23 +110,56 @@ class LoggingDataBlock(ModbusSequentialDataBlock):
         super().__init__(address, list(values))
         self._table = table
         self._request_logger = request_logger
+        # Serializes access with resize(): pymodbus validates a request
+        # before serving it, so the table may shrink in between. A slice
+        # assignment past the end would silently grow the table again and a
+        # slice read would come back short.
+        self._resize_lock = threading.Lock()
 
     def getValues(self, address: int, count: int = 1) -> list[int]:  # noqa: N802
         self._request_logger.log_read(self._table, address, count)
-        return super().getValues(address, count)
+        with self._resize_lock:
+            size = len(self.values)  # type: ignore[attr-defined]
+            start = address - self.address
+            if start < 0 or start + count > size:
+                # pymodbus answers the DVP with an exception response.
+                raise ValueError(
+                    f"read of {count} from {self._table} at {address} is past "
+                    f"the table, resized to {size} points"
+                )
+            return super().getValues(address, count)
 
     def setValues(  # noqa: N802
         self, address: int, values: Sequence[int] | int
     ) -> None:
         data = list(values) if isinstance(values, Sequence) else [int(values)]
         self._request_logger.log_write(self._table, address, data)
-        super().setValues(address, data)
+        self._set_in_bounds(address, data)
+
+    def snapshot(self, start: int = 0, count: int | None = None) -> list[int]:
+        """Return the current values without emitting Modbus logs.
 
-    def snapshot(self) -> list[int]:
-        """Return the current values without emitting Modbus logs."""
+        ``start``/``count`` restrict the copy to a window of the table.
+        """
 
         # Access to ``values`` is guarded by the parent class lock.
-        return list(self.values)  # type: ignore[attr-defined]
+        values = self.values  # type: ignore[attr-defined]
+        stop = len(values) if count is None else start + count
+        return values[start:stop]
+
+    def resize(self, count: int) -> None:
+        """Grow (zero-filled) or truncate the table in place.
+
+        The list object is kept, so a request served concurrently sees either
+        the old or the new size, never a missing table.
+        """
+
+        with self._resize_lock:
+            values = self.values  # type: ignore[attr-defined]
+            if count > len(values):
+                values.extend([0] * (count - len(values)))
+            else:
+                del values[count:]
 
     def write_local(self, address: int, values: Sequence[int] | int) -> None:
         """Update values initiated from the local host (e.g. web UI)."""
@@ -119,25 +171,87 @@ class LoggingDataBlock(ModbusSequentialDataBlock):
             address,
             data,
         )
-        ModbusSequentialDataBlock.setValues(self, address, data)
+        self._set_in_bounds(address, data)
+
+    def _set_in_bounds(self, address: int, data: list[int]) -> None:
+        with self._resize_lock:
+            start = address - self.address
+            if start + len(data) > len(self.values):  # type: ignore[attr-defined]
+                _LOGGER.warning(
+                    "Dropping write to %s at %d: table was resized to %d points",
+                    self._table,
+                    address,
+                    len(self.values),  # type: ignore[attr-defined]
+                )
+                return
+            ModbusSequentialDataBlock.setValues(self, address, data)
+
+
+@dataclass(slots=True)
+class SerialLinkStats:
+    """Health of the serial link as seen by the supervising slave."""
+
+    connected: bool = False
+    reconnects: int = 0
+    downtime: float = 0.0
+    down_since: float | None = None
+    last_error: str | None = None
+    restarting: bool = False
+
+    def as_dict(self, now: float) -> dict[str, object]:
+        """Return a JSON-friendly view, counting the ongoing outage."""
+
+        downtime = self.downtime
+        if self.down_since is not None:
+            downtime += now - self.down_since
+        return {
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+            "downtimeSeconds": round(downtime, 3),
+            "lastError": self.last_error,
+        }
 
 
 @dataclass(slots=True)
 class ModbusSlave:
-    """Serial Modbus slave ready to talk with Delta DVP."""
+    """Serial Modbus slave ready to talk with Delta DVP.
+
+    :meth:`serve_forever` supervises the serial server: when the port goes
+    away it keeps the register context (and anything reading it, such as the
+    web UI) alive and reopens the port with exponential backoff between
+    ``reconnect_delay`` and ``reconnect_delay_max`` seconds. The link counts
+    as connected only while pymodbus holds the port; a server that has not
+    opened it within ``open_timeout`` seconds is restarted.
+    :meth:`reconfigure` changes the table size, unit id or line settings
+    while running.
+    """
 
     config: SerialConnectionConfig
     request_logger: DeltaRequestLogger
     data_points: int = 128
     unit_id: int = 1
+    reconnect_delay: float = 0.1
+    reconnect_delay_max: float = 5.0
+    poll_interval: float = 0.2
+    open_timeout: float = 2.0
     _blocks: dict[str, LoggingDataBlock] = field(init=False, repr=False)
     _context: ModbusServerContext = field(init=False, repr=False)
     _identity: ModbusDeviceIdentification = field(init=False, repr=False)
+    _stats: SerialLinkStats = field(init=False, repr=False)
+    _stats_lock: threading.Lock = field(init=False, repr=False)
+    _stop: threading.Event = field(init=False, repr=False)
+    _restart: threading.Event = field(init=False, repr=False)
+    _reconfigure_lock: threading.Lock = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._blocks = self._build_blocks()
         self._context = self._build_context()
         self._identity = self._build_identity()
+        self._stats = SerialLinkStats()
+        self._stats_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._restart = threading.Event()
+        self._reconfigure_lock = threading.Lock()
 
     def _build_blocks(self) -> dict[str, LoggingDataBlock]:
         return {
@@ -147,12 +261,7 @@ class ModbusSlave:
                 table=table,
                 request_logger=self.request_logger,
             )
-            for table in (
-                "discrete_inputs",
-                "coils",
-                "holding_registers",
-                "input_registers",
-            )
+            for table in TABLES
         }
 
     def _build_context(self) -> ModbusServerContext:
@@ -175,20 +284,261 @@ class ModbusSlave:
         return identity
 
     def serve_forever(self) -> None:
-        """Start the Modbus RTU slave loop."""
+        """Run the Modbus RTU slave, reopening the port whenever it is lost."""
 
         _LOGGER.info("Starting Modbus slave on %s", self.config.port)
-        StartSerialServer(  # pragma: no cover - integration behaviour
-            context=self._context,
-            identity=self._identity,
-            framer=ModbusRtuFramer,
-            **self.config.as_dict(),
+        self._stop.clear()
+        with self._stats_lock:
+            if not self._stats.connected:
+                self._stats.down_since = time.monotonic()
+        delay = self.reconnect_delay
+        while not self._stop.is_set():
+            opened_at = time.monotonic()
+            try:
+                self._serve_session()
+                error = "serial server stopped"
+            except (OSError, ValueError) as exc:  # SerialException is an OSError
+                error = str(exc) or type(exc).__name__
+            if self._stop.is_set():
+                break
+            if self._restart.is_set():
+                self._restart.clear()
+                self._mark_down(restarting=True)
+                delay = self.reconnect_delay
+                continue
+            lost_at = time.monotonic()
+            with self._stats_lock:
+                if self._stats.connected:
+                    self._stats.connected = False
+                    self._stats.down_since = lost_at
+                self._stats.last_error = error
+                self._stats.restarting = False
+            if lost_at - opened_at >= self.reconnect_delay_max:
+                delay = self.reconnect_delay
+            _LOGGER.warning(
+                "Serial port %s unavailable (%s); retrying in %.2fs",
+                self.config.port,
+                error,
+                delay,
+            )
+            self._stop.wait(delay)
+            delay = min(delay * 2, self.reconnect_delay_max)
+        self._mark_down()
+
+    def stop(self) -> None:
+        """Ask :meth:`serve_forever` to close the port and return."""
+
+        self._stop.set()
+        with suppress(Exception):
+            ServerStop()
+
+    def reconfigure(
+        self,
+        *,
+        config: SerialConnectionConfig | None = None,
+        data_points: int | None = None,
+        unit_id: int | None = None,
+    ) -> None:
+        """Apply new settings without restarting the process.
+
+        Tables are resized in place, keeping the values that fit. A new unit
+        id is registered before the old one is dropped, so the DVP is always
+        answered. Changed line settings restart only the serial server, which
+        reopens the port immediately instead of going through backoff.
+        """
+
+        if data_points is not None and not (1 <= data_points <= 5000):
+            raise ValueError("data_points must be in 1..5000")
+        if unit_id is not None and not (1 <= unit_id <= 247):
+            raise ValueError("unit_id must be in 1..247")
+
+        with self._reconfigure_lock:
+            if data_points is not None and data_points != self.data_points:
+                _LOGGER.info(
+                    "Resizing tables from %d to %d points",
+                    self.data_points,
+                    data_points,
+                )
+                for block in self._blocks.values():
+                    block.resize(data_points)
+                self.data_points = data_points
+            if unit_id is not None and unit_id != self.unit_id:
+                _LOGGER.info("Changing unit id from %d to %d", self.unit_id, unit_id)
+                self._context[unit_id] = self._context[self.unit_id]
+                del self._context[self.unit_id]
+                self.unit_id = unit_id
+            if config is not None and config != self.config:
+                _LOGGER.info("Reopening serial port with %s", config.as_dict())
+                self.config = config
+                self._restart.set()
+                with suppress(Exception):
+                    ServerStop()
+
+    def serial_status(self) -> dict[str, object]:
+        """Return connection state, reconnect count and accumulated downtime."""
+
+        with self._stats_lock:
+            status = self._stats.as_dict(time.monotonic())
+        status["port"] = self.config.port
+        return status
+
+    def _serve_session(self) -> None:
+        """Serve until the port disappears; raise on open/serve errors."""
+
+        self._restart.clear()
+        device = self._wait_for_device()
+        if device is None:
+            return
+        self._probe_port()
+
+        errors: list[BaseException] = []
+        stale = self._active_server()
+        worker = threading.Thread(
+            target=self._run_server, args=(errors,), name="modbus-serial", daemon=True
         )
+        worker.start()
+        open_deadline = time.monotonic() + self.open_timeout
+        is_open = False
+        while worker.is_alive():
+            worker.join(self.poll_interval if is_open else _OPEN_POLL_INTERVAL)
+            if not worker.is_alive():
+                break
+            if self._stop.is_set() or self._restart.is_set():
+                self._stop_server(worker)
+                return
+            if self._device_id() != device:
+                self._stop_server(worker)
+                raise OSError(f"device {self.config.port} disappeared")
+            if self._port_open(stale):
+                if not is_open:
+                    is_open = True
+                    self._mark_up()
+            elif is_open:
+                self._stop_server(worker)
+                raise OSError(f"serial server lost {self.config.port}")
+            elif time.monotonic() >= open_deadline:
+                self._stop_server(worker)
+                raise OSError(f"serial server did not open {self.config.port}")
+        if errors:
+            raise errors[0]
+
+    def _stop_server(self, worker: threading.Thread) -> None:
+        with suppress(Exception):
+            ServerStop()
+        worker.join(self.poll_interval * 5)
+
+    @staticmethod
+    def _active_server() -> object | None:
+        if _serverList is None:
+            return None
+        return getattr(_serverList, "active_server", None)
+
+    def _port_open(self, stale: object | None) -> bool:
+        """Tell whether the server started by this session holds the port.
+
+        ``stale`` is the registry entry seen before the session started, so
+        a server left over from a failed session is not mistaken for ours.
+        Without the pymodbus registry a running worker is all we can check.
+        """
+
+        if _serverList is None:
+            return True
+        active = self._active_server()
+        if active is None or active is stale:
+            return False
+        return getattr(getattr(active, "server", None), "transport", None) is not None
+
+    def _run_server(self, errors: list[BaseException]) -> None:
+        try:
+            StartSerialServer(  # pragma: no cover - integration behaviour
+                context=self._context,
+                identity=self._identity,
+                framer=ModbusRtuFramer,
+                **self.config.as_dict(),
+            )
+        except Exception as exc:  # pragma: no cover - reported to supervisor
+            errors.append(exc)
+
+    def _wait_for_device(self) -> tuple[int, int] | None:
+        """Block until the port's device node exists (udev may recreate it)."""
+
+        logged = False
+        while not self._stop.is_set():
+            device = self._device_id()
+            if device is not None:
+                return device
+            if not logged:
+                _LOGGER.warning("Waiting for %s to appear", self.config.port)
+                logged = True
+            self._stop.wait(self.poll_interval)
+        return None
+
+    def _device_id(self) -> tuple[int, int] | None:
+        """Identify the device node so a re-created node counts as a loss.
+
+        Ports that are not filesystem paths (e.g. ``rfc2217://``) always
+        report a constant identity.
+        """
+
+        if not os.path.isabs(self.config.port):
+            return (0, 0)
+        try:
+            info = os.stat(self.config.port)
+        except OSError:
+            return None
+        return info.st_ino, info.st_rdev
+
+    def _probe_port(self) -> None:
+        # Newer pymodbus only logs a failed open and idles, so check first.
+        if serial is None:
+            return
+        params = self.config.as_dict()
+        port = serial.serial_for_url(
+            params.pop("port"), do_not_open=True, **params
+        )
+        port.open()
+        port.close()
+
+    def _mark_up(self) -> None:
+        now = time.monotonic()
+        with self._stats_lock:
+            if self._stats.connected:
+                return
+            if self._stats.down_since is not None:
+                # A reopen after reconfigure() is planned, not a reconnect.
+                if self._stats.last_error is not None and not self._stats.restarting:
+                    self._stats.reconnects += 1
+                    _LOGGER.info(
+                        "Serial port %s reopened after %.2fs",
+                        self.config.port,
+                        now - self._stats.down_since,
+                    )
+                self._stats.downtime += now - self._stats.down_since
+            self._stats.connected = True
+            self._stats.down_since = None
+            self._stats.restarting = False
+
+    def _mark_down(self, restarting: bool = False) -> None:
+        with self._stats_lock:
+            if self._stats.connected:
+                self._stats.connected = False
+                self._stats.down_since = time.monotonic()
+                self._stats.restarting = restarting
+
+    def snapshot(
+        self,
+        start: int = 0,
+        count: int | None = None,
+        tables: Iterable[str] | None = None,
+    ) -> dict[str, list[int]]:
+        """Return a copy of the current Modbus table values.
 
-    def snapshot(self) -> dict[str, list[int]]:
-        """Return a copy of the current Modbus table values."""
+        ``start``/``count`` select the same address window in every table;
+        ``tables`` limits the copy to the named tables.
+        """
 
-        return {table: block.snapshot() for table, block in self._blocks.items()}
+        names = self._blocks if tables is None else tables
+        return {table: self._blocks[table].snapshot(start, count) for table in names}
 
     def write_table(self, table: str, address: int, values: Sequence[int] | int) -> None:
         """Write values to one of the Modbus tables."""
@@ -200,9 +550,10 @@ class ModbusSlave:
         data = list(values) if isinstance(values, Sequence) else [int(values)]
         if not data:
             raise ValueError("No values provided")
-        if address + len(data) > self.data_points:
-            raise ValueError("Write exceeds configured data size")
-        self._blocks[table].write_local(address, data)
+        with self._reconfigure_lock:
+            if address + len(data) > self.data_points:
+                raise ValueError("Write exceeds configured data size")
+            self._blocks[table].write_local(address, data)
 
     @property
     def tables(self) -> tuple[str, ...]:
@@ -0,0 +1,321 @@
+"""Structured JSONL sink for Delta DVP traffic."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Sequence
+
+from .scanner import DeltaRequestLogger
+
+_LOGGER = logging.getLogger(__name__)
+
+OPERATIONS = ("read", "write")
+
+
+@dataclass(frozen=True, slots=True)
+class TrafficFilter:
+    """Selects which Delta requests end up in the traffic log.
+
+    ``tables`` set to ``None`` accepts every table. The address range is
+    inclusive; a request is kept when any of its addresses falls inside it.
+    """
+
+    tables: frozenset[str] | None = None
+    operations: frozenset[str] = frozenset(OPERATIONS)
+    address_min: int = 0
+    address_max: int | None = None
+
+    def matches(self, operation: str, table: str, address: int, count: int) -> bool:
+        if operation not in self.operations:
+            return False
+        if self.tables is not None and table not in self.tables:
+            return False
+        last = address + max(count, 1) - 1
+        if last < self.address_min:
+            return False
+        if self.address_max is not None and address > self.address_max:
+            return False
+        return True
+
+
+class JsonlTrafficLogger(DeltaRequestLogger):
+    """Writes Delta requests as JSON lines with buffered, rotated output.
+
+    Records are kept in memory and written in one sequential chunk by a
+    background thread once ``buffer_size`` bytes accumulate or
+    ``flush_interval`` seconds pass (``0`` disables the periodic flush).
+    The active segment is rotated when it would exceed ``max_bytes`` or
+    when it is older than ``rotate_interval`` seconds; rotated segments
+    are gzipped by a background worker and only ``backup_count`` of them
+    are kept.
+
+    The logger runs on the Modbus request path: callers only append to the
+    buffer under a short lock, while writes and rotation happen in the
+    flusher under a separate I/O lock. I/O failures (e.g. a full disk) are
+    logged and the affected records dropped; they never reach the caller.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        buffer_size: int = 64 * 1024,
+        flush_interval: float = 5.0,
+        max_bytes: int = 16 * 1024 * 1024,
+        rotate_interval: float | None = None,
+        backup_count: int = 10,
+        compress: bool = True,
+        traffic_filter: TrafficFilter | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self._buffer_size = buffer_size
+        self._flush_interval = flush_interval
+        self._max_bytes = max_bytes
+        self._rotate_interval = rotate_interval
+        self._backup_count = backup_count
+        self._compress = compress
+        self._filter = traffic_filter or TrafficFilter()
+        self._clock = clock
+
+        self._lock = threading.Lock()  # guards the buffer only
+        self._io_lock = threading.Lock()  # guards the stream and segment state
+        self._wake = threading.Event()
+        self._pending: list[bytes] = []
+        self._pending_bytes = 0
+        self._closed = False
+        self._finished = False
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._stream: BinaryIO | None = open(self.path, "ab")  # noqa: SIM115
+        self._segment_bytes = self._stream.tell()
+        self._segment_started = self._clock()
+        self._reopen_failed = False
+
+        self._stop = threading.Event()
+        self._compress_queue: queue.Queue[Path | None] = queue.Queue()
+        self._compressor = threading.Thread(
+            target=self._compress_worker, name="traffic-log-gzip", daemon=True
+        )
+        self._compressor.start()
+        self._flusher = threading.Thread(
+            target=self._flush_worker, name="traffic-log-flush", daemon=True
+        )
+        self._flusher.start()
+
+    def log_read(self, table: str, address: int, count: int) -> None:
+        """Record an incoming read request from Delta DVP."""
+
+        if not self._filter.matches("read", table, address, count):
+            return
+        self._append(
+            {
+                "ts": round(self._clock(), 6),
+                "op": "read",
+                "table": table,
+                "address": address,
+                "count": count,
+            }
+        )
+
+    def log_write(self, table: str, address: int, values: Sequence[int]) -> None:
+        """Record an incoming write request from Delta DVP."""
+
+        data = [int(v) for v in values]
+        if not self._filter.matches("write", table, address, len(data)):
+            return
+        self._append(
+            {
+                "ts": round(self._clock(), 6),
+                "op": "write",
+                "table": table,
+                "address": address,
+                "count": len(data),
+                "values": data,
+            }
+        )
+
+    def flush(self) -> None:
+        """Write buffered records to the active segment.
+
+        Runs in the flusher thread; request threads never call it.
+        """
+
+        with self._io_lock:
+            if not self._finished:
+                self._drain_locked()
+
+    def close(self) -> None:
+        """Flush pending records, stop workers and wait for compression."""
+
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._stop.set()
+        self._wake.set()
+        self._flusher.join()
+        with self._io_lock:
+            self._drain_locked()
+            self._close_stream()
+            self._finished = True
+        self._compress_queue.put(None)
+        self._compressor.join()
+
+    def _append(self, record: dict[str, object]) -> None:
+        line = json.dumps(record, separators=(",", ":")).encode("utf-8") + b"\n"
+        with self._lock:
+            if self._closed:
+                return
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            full = self._pending_bytes >= self._buffer_size
+        if full:
+            self._wake.set()
+
+    def _drain_locked(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._pending_bytes = 0
+        try:
+            self._write_locked(b"".join(pending))
+        except Exception:  # pragma: no cover - never break Modbus service
+            _LOGGER.exception("Traffic log %s failed; dropping records", self.path)
+
+    def _write_locked(self, chunk: bytes) -> None:
+        if self._should_rotate(len(chunk)):
+            self._rotate_locked()
+        if self._stream is None:
+            self._reopen_locked()
+        if not chunk or self._stream is None:
+            return
+        try:
+            self._stream.write(chunk)
+            self._stream.flush()
+        except OSError as exc:
+            _LOGGER.error("Failed to write traffic log %s: %s", self.path, exc)
+            return
+        self._segment_bytes += len(chunk)
+
+    def _should_rotate(self, incoming: int) -> bool:
+        if self._segment_bytes == 0:
+            return False
+        if self._segment_bytes + incoming > self._max_bytes:
+            return True
+        if self._rotate_interval is not None:
+            return self._clock() - self._segment_started >= self._rotate_interval
+        return False
+
+    def _rotate_locked(self) -> None:
+        self._close_stream()
+        # Start a new segment even if the rename fails, so a persistent error
+        # is retried at the next rotation point rather than on every flush.
+        self._segment_bytes = 0
+        self._segment_started = self._clock()
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(self._clock()))
+        target = self.path.with_name(f"{self.path.name}.{stamp}")
+        suffix = 1
+        while target.exists() or target.with_name(target.name + ".gz").exists():
+            target = self.path.with_name(f"{self.path.name}.{stamp}.{suffix}")
+            suffix += 1
+        try:
+            os.replace(self.path, target)
+        except OSError as exc:
+            _LOGGER.error("Failed to rotate traffic log %s: %s", self.path, exc)
+        else:
+            _LOGGER.debug("Rotated traffic log to %s", target)
+            self._compress_queue.put(target)
+        self._reopen_locked()
+
+    def _reopen_locked(self) -> None:
+        """Open the active segment; on failure records are dropped until it works."""
+
+        try:
+            self._stream = open(self.path, "ab")  # noqa: SIM115
+        except OSError as exc:
+            self._stream = None
+            if not self._reopen_failed:
+                _LOGGER.error(
+                    "Failed to open traffic log %s, dropping records: %s",
+                    self.path,
+                    exc,
+                )
+            self._reopen_failed = True
+            return
+        if self._reopen_failed:
+            _LOGGER.info("Traffic log %s reopened", self.path)
+        self._reopen_failed = False
+
+    def _close_stream(self) -> None:
+        if self._stream is None:
+            return
+        try:
+            self._stream.close()
+        except OSError as exc:
+            _LOGGER.error("Failed to close traffic log %s: %s", self.path, exc)
+        self._stream = None
+
+    def _flush_worker(self) -> None:
+        timeout = self._flush_interval if self._flush_interval > 0 else None
+        while not self._stop.is_set():
+            self._wake.wait(timeout)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            self.flush()
+
+    def _compress_worker(self) -> None:
+        while True:
+            segment = self._compress_queue.get()
+            if segment is None:
+                return
+            try:
+                if self._compress:
+                    self._compress_segment(segment)
+                self._prune_backups()
+            except Exception:  # pragma: no cover - keep the worker alive
+                _LOGGER.exception("Traffic log housekeeping failed for %s", segment)
+
+    def _compress_segment(self, segment: Path) -> None:
+        target = segment.with_name(segment.name + ".gz")
+        try:
+            with open(segment, "rb") as src, gzip.open(target, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            segment.unlink()
+        except OSError as exc:
+            _LOGGER.error("Failed to compress %s: %s", segment, exc)
+
+    def _prune_backups(self) -> None:
+        """Keep the newest ``backup_count`` finished segments.
+
+        With compression on only ``.gz`` files count, so raw segments still
+        waiting for the compressor are never removed.
+        """
+
+        if self._backup_count < 0:
+            return
+        backups: list[tuple[float, Path]] = []
+        for item in self.path.parent.glob(f"{self.path.name}.*"):
+            if (item.suffix == ".gz") != self._compress:
+                continue
+            try:
+                backups.append((item.stat().st_mtime, item))
+            except OSError:  # removed meanwhile, e.g. by an external logrotate
+                continue
+        backups.sort()
+        excess = len(backups) - self._backup_count
+        for _, old in backups[: max(excess, 0)]:
+            try:
+                old.unlink()
+            except OSError as exc:
+                _LOGGER.warning("Failed to remove old traffic log %s: %s", old, exc)
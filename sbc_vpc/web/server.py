@@ -10,6 +10,7 @@ from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from importlib import resources
 from typing import Any, Callable
+from urllib.parse import parse_qs, urlsplit
 
 from ..modbus import ModbusSlave
 
@@ -21,13 +22,23 @@ def _load_index_template() -> bytes:
     return path.read_bytes()
 
 
-def _build_handler(slave: ModbusSlave) -> type[BaseHTTPRequestHandler]:
+def _build_handler(
+    slave: ModbusSlave, reload: Callable[[], dict[str, object]] | None
+) -> type[BaseHTTPRequestHandler]:
     index_bytes = _load_index_template()
     tables = slave.tables
 
     class WebUIRequestHandler(BaseHTTPRequestHandler):
         server_version = "SBCWebUI/0.1"
+        # Every response carries Content-Length, so clients may keep the
+        # connection open; idle ones are dropped after ``timeout`` seconds.
+        # Headers and body go out in separate writes, which Nagle would hold
+        # back until the client's delayed ACK on a kept-alive connection.
+        protocol_version = "HTTP/1.1"
+        timeout = 30
+        disable_nagle_algorithm = True
         _slave = slave
+        _reload = staticmethod(reload) if reload is not None else None
         _index = index_bytes
         _allowed_tables = tables
 
@@ -38,25 +49,84 @@ def _build_handler(slave: ModbusSlave) -> type[BaseHTTPRequestHandler]:
             if self.path in {"/", "/index.html"}:
                 self._send_bytes(self._index, "text/html; charset=utf-8")
                 return
-            if self.path == "/api/state":
-                state = self._slave.snapshot()
-                payload = {
-                    "tables": {
-                        name: state[name] for name in self._allowed_tables
-                    },
-                    "dataPoints": self._slave.data_points,
-                    "unitId": self._slave.unit_id,
-                }
-                self._send_json(payload)
+            url = urlsplit(self.path)
+            if url.path == "/api/state":
+                self._send_state(parse_qs(url.query))
                 return
             self._send_error(HTTPStatus.NOT_FOUND, "Not Found")
 
+        def _send_state(self, query: dict[str, list[str]]) -> None:
+            # ``offset``/``limit`` set the window for every table; a table
+            # given as ``NAME=OFFSET:LIMIT`` gets its own window, so the UI
+            # fetches all visible windows in one request.
+            data_points = self._slave.data_points
+            try:
+                offset = int(query.get("offset", ["0"])[0])
+                limit = int(query.get("limit", [str(data_points)])[0])
+                windows = {
+                    name: self._parse_window(query[name][0], limit)
+                    for name in self._allowed_tables
+                    if name in query
+                }
+            except ValueError:
+                self._send_error(
+                    HTTPStatus.BAD_REQUEST, "Offset and limit must be integers"
+                )
+                return
+            if min(offset, limit, *(min(w) for w in windows.values())) < 0:
+                self._send_error(
+                    HTTPStatus.BAD_REQUEST, "Offset and limit must be non-negative"
+                )
+                return
+            selected = set(windows)
+            if "tables" in query:
+                listed = {
+                    name
+                    for raw in query["tables"]
+                    for name in raw.split(",")
+                    if name
+                }
+                if not listed <= set(self._allowed_tables):
+                    self._send_error(HTTPStatus.BAD_REQUEST, "Unknown table")
+                    return
+                selected |= listed
+            names = (
+                [name for name in self._allowed_tables if name in selected]
+                if selected or "tables" in query
+                else self._allowed_tables
+            )
+            tables: dict[str, list[int]] = {}
+            offsets: dict[str, int] = {}
+            for name in names:
+                start, count = windows.get(name, (offset, limit))
+                start = min(start, data_points)
+                count = min(count, data_points - start)
+                tables[name] = self._slave.snapshot(start, count, (name,))[name]
+                offsets[name] = start
+            payload = {
+                "tables": tables,
+                "offset": min(offset, data_points),
+                "offsets": offsets,
+                "dataPoints": data_points,
+                "unitId": self._slave.unit_id,
+                "serial": self._slave.serial_status(),
+            }
+            self._send_json(payload)
+
+        @staticmethod
+        def _parse_window(raw: str, default_limit: int) -> tuple[int, int]:
+            start, sep, count = raw.partition(":")
+            return int(start), int(count) if sep and count else default_limit
+
         def do_POST(self) -> None:  # noqa: N802 - BaseHTTPRequestHandler API
+            content_length = int(self.headers.get("Content-Length", "0"))
+            body = self.rfile.read(content_length)
+            if self.path == "/api/reload":
+                self._handle_reload()
+                return
             if self.path != "/api/write":
                 self._send_error(HTTPStatus.NOT_FOUND, "Not Found")
                 return
-            content_length = int(self.headers.get("Content-Length", "0"))
-            body = self.rfile.read(content_length)
             try:
                 payload = json.loads(body.decode("utf-8"))
             except json.JSONDecodeError:
@@ -87,6 +157,19 @@ def _build_handler(slave: ModbusSlave) -> type[BaseHTTPRequestHandler]:
                 return
             self._send_json({"status": "ok"})
 
+        def _handle_reload(self) -> None:
+            if self._reload is None:
+                self._send_error(
+                    HTTPStatus.NOT_FOUND, "Reload is not configured (use --config)"
+                )
+                return
+            try:
+                applied = self._reload()
+            except (OSError, ValueError) as exc:
+                self._send_error(HTTPStatus.BAD_REQUEST, str(exc))
+                return
+            self._send_json({"status": "ok", "config": applied})
+
         def _send_json(self, payload: Any, status: HTTPStatus = HTTPStatus.OK) -> None:
             data = json.dumps(payload).encode("utf-8")
             self.send_response(status)
@@ -109,6 +192,11 @@ def _build_handler(slave: ModbusSlave) -> type[BaseHTTPRequestHandler]:
     return WebUIRequestHandler
 
 
+class _WebHTTPServer(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs when several panels connect at once.
+    request_queue_size = 64
+
+
 @dataclass
 class WebUIServer:
     """Wraps the HTTP server responsible for the embedded web UI."""
@@ -116,10 +204,11 @@ class WebUIServer:
     slave: ModbusSlave
     host: str = "0.0.0.0"
     port: int = 8080
+    reload: Callable[[], dict[str, object]] | None = None
 
     def __post_init__(self) -> None:
-        handler = _build_handler(self.slave)
-        self._server = ThreadingHTTPServer((self.host, self.port), handler)
+        handler = _build_handler(self.slave, self.reload)
+        self._server = _WebHTTPServer((self.host, self.port), handler)
         address, port = self._server.server_address
         _LOGGER.info("Web UI bound to http://%s:%s", address, port)
 
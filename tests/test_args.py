@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import argparse
+import json
+from pathlib import Path
+
 import pytest
 
-from sbc_vpc.__main__ import build_arg_parser, main
-from sbc_vpc.config import SerialConnectionConfig
+from sbc_vpc.__main__ import (
+    build_arg_parser,
+    explicit_settings,
+    main,
+    parse_address_range,
+)
+from sbc_vpc.config import SerialConnectionConfig, load_config_file
 
 
 def test_arg_parser_unit_id_default_and_override() -> None:
@@ -47,3 +56,74 @@ def test_main_rejects_invalid_web_port() -> None:
     with pytest.raises(SystemExit) as exc_info:
         main(["--web-port", "70000", "--no-web"])
     assert exc_info.value.code == 2
+
+
+def test_parse_address_range() -> None:
+    assert parse_address_range("10-20") == (10, 20)
+    assert parse_address_range("7") == (7, 7)
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_address_range("20-10")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_address_range("a-b")
+
+
+def test_load_config_file_normalizes_keys(tmp_path: Path) -> None:
+    path = tmp_path / "sbc.json"
+    path.write_text(json.dumps({"data-points": 256, "unit_id": 3, "timeout": 2}))
+
+    assert load_config_file(path) == {
+        "data_points": 256,
+        "unit_id": 3,
+        "timeout": 2.0,
+    }
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [{"web_port": 80}, {"parity": "X"}, {"baudrate": "fast"}, {"unit_id": True}, []],
+)
+def test_load_config_file_rejects_invalid_settings(
+    tmp_path: Path, payload: object
+) -> None:
+    path = tmp_path / "sbc.json"
+    path.write_text(json.dumps(payload))
+
+    with pytest.raises(ValueError):
+        load_config_file(path)
+
+
+def test_main_rejects_invalid_config_file(tmp_path: Path) -> None:
+    path = tmp_path / "sbc.json"
+    path.write_text(json.dumps({"data_points": 9000}))
+
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--config", str(path), "--no-web"])
+    assert exc_info.value.code == 2
+
+
+def test_main_rejects_traffic_filters_without_traffic_log() -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(["--traffic-log-ops", "write", "--no-web"])
+    assert exc_info.value.code == 2
+
+
+def test_main_rejects_zero_traffic_log_backups(tmp_path: Path) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        main(
+            [
+                "--traffic-log",
+                str(tmp_path / "traffic.jsonl"),
+                "--traffic-log-backups",
+                "0",
+                "--no-web",
+            ]
+        )
+    assert exc_info.value.code == 2
+
+
+def test_explicit_settings_lists_only_given_options() -> None:
+    assert explicit_settings(["--baudrate", "19200", "--unit-id", "3", "--no-web"]) == {
+        "baudrate",
+        "unit_id",
+    }
+    assert explicit_settings([]) == frozenset()
@@ -37,3 +37,34 @@ def test_logging_data_block_records_reads_and_writes() -> None:
         ("write", "holding_registers", 1, [10, 11]),
         ("read", "holding_registers", 1, 2),
     ]
+
+
+def test_logging_data_block_resize_keeps_values() -> None:
+    block = LoggingDataBlock(0, [1, 2, 3, 4], "coils", _Recorder())
+    values = block.values
+
+    block.resize(6)
+    assert block.snapshot() == [1, 2, 3, 4, 0, 0]
+    block.resize(2)
+    assert block.snapshot() == [1, 2]
+    assert block.values is values
+
+
+def test_logging_data_block_write_cannot_regrow_truncated_table() -> None:
+    block = LoggingDataBlock(0, [0] * 8, "holding_registers", _Recorder())
+
+    block.resize(2)
+    block.setValues(7, [1])
+    block.write_local(1, [3, 4])
+
+    assert block.snapshot() == [0, 0]
+
+
+def test_logging_data_block_read_fails_after_concurrent_shrink() -> None:
+    block = LoggingDataBlock(0, [1] * 8, "holding_registers", _Recorder())
+
+    assert block.validate(4, 4)
+    block.resize(6)
+    with pytest.raises(ValueError):
+        block.getValues(4, 4)
+    assert block.getValues(4, 2) == [1, 1]
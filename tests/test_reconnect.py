@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pymodbus")
+
+from sbc_vpc.config import SerialConnectionConfig
+from sbc_vpc.modbus import scanner
+from sbc_vpc.modbus.scanner import DeltaRequestLogger, ModbusSlave
+
+
+class _FakeSerialServer:
+    """Stands in for ``StartSerialServer``: fails ``failures`` times, then blocks.
+
+    Like pymodbus it registers itself as ``active_server``; with
+    ``open_port`` false it idles without a transport, as pymodbus does after
+    a failed open.
+    """
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.open_port = True
+        self.calls = 0
+        self.active_server: SimpleNamespace | None = None
+        self._release = threading.Event()
+
+    def start(self, **_kwargs: object) -> None:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise OSError("port gone")
+        transport = object() if self.open_port else None
+        self.active_server = SimpleNamespace(server=SimpleNamespace(transport=transport))
+        self._release.wait()
+        self._release.clear()
+
+    def stop(self) -> None:
+        self.active_server = None
+        self._release.set()
+
+
+@pytest.fixture()
+def fake_server(monkeypatch: pytest.MonkeyPatch) -> _FakeSerialServer:
+    fake = _FakeSerialServer()
+    monkeypatch.setattr(scanner, "StartSerialServer", fake.start)
+    monkeypatch.setattr(scanner, "ServerStop", fake.stop)
+    monkeypatch.setattr(scanner, "serial", None)
+    monkeypatch.setattr(scanner, "_serverList", fake)
+    return fake
+
+
+def _wait_for(predicate, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.01)
+
+
+def _start(slave: ModbusSlave) -> threading.Thread:
+    thread = threading.Thread(target=slave.serve_forever, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_slave_retries_failed_opens_with_backoff(fake_server: _FakeSerialServer) -> None:
+    fake_server.failures = 3
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        reconnect_delay=0.01,
+        reconnect_delay_max=0.05,
+        poll_interval=0.01,
+    )
+    slave.write_table("holding_registers", 0, [7])
+    thread = _start(slave)
+
+    _wait_for(lambda: slave.serial_status()["connected"])
+    status = slave.serial_status()
+    assert fake_server.calls == 4
+    assert status["reconnects"] == 1
+    assert status["lastError"] == "port gone"
+    assert status["downtimeSeconds"] >= 0.01 + 0.02 + 0.04
+    assert slave.snapshot()["holding_registers"][0] == 7
+
+    slave.stop()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+    assert not slave.serial_status()["connected"]
+
+
+def test_slave_waits_for_device_node_to_reappear(
+    fake_server: _FakeSerialServer, tmp_path: Path
+) -> None:
+    device = tmp_path / "ttyUSB0"
+    device.touch()
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port=str(device)),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        reconnect_delay=0.01,
+        reconnect_delay_max=0.05,
+        poll_interval=0.01,
+    )
+    thread = _start(slave)
+    _wait_for(lambda: slave.serial_status()["connected"])
+
+    device.unlink()
+    _wait_for(lambda: not slave.serial_status()["connected"])
+    assert "disappeared" in slave.serial_status()["lastError"]
+    time.sleep(0.1)
+    assert fake_server.calls == 1
+
+    device.touch()
+    _wait_for(lambda: slave.serial_status()["connected"])
+    assert slave.serial_status()["reconnects"] == 1
+    assert fake_server.calls == 2
+
+    slave.stop()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+def test_slave_is_down_until_server_opens_port(fake_server: _FakeSerialServer) -> None:
+    fake_server.open_port = False
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        reconnect_delay=0.01,
+        reconnect_delay_max=0.05,
+        poll_interval=0.01,
+        open_timeout=0.05,
+    )
+    thread = _start(slave)
+
+    _wait_for(lambda: fake_server.calls >= 2)
+    status = slave.serial_status()
+    assert not status["connected"]
+    assert "did not open" in status["lastError"]
+
+    fake_server.open_port = True
+    _wait_for(lambda: slave.serial_status()["connected"])
+    assert slave.serial_status()["reconnects"] == 1
+
+    slave.stop()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+def test_slave_marks_up_as_soon_as_port_opens(fake_server: _FakeSerialServer) -> None:
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        poll_interval=1.0,
+    )
+    thread = _start(slave)
+
+    _wait_for(lambda: slave.serial_status()["connected"], timeout=0.5)
+    assert slave.serial_status()["downtimeSeconds"] < 0.2
+
+    slave.stop()
+    thread.join(timeout=1)
+    assert not thread.is_alive()
+
+
+def test_reconfigure_resizes_and_moves_unit_id(fake_server: _FakeSerialServer) -> None:
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+    )
+    slave.write_table("holding_registers", 1, [5, 6, 7])
+    context = slave._context
+
+    slave.reconfigure(data_points=8, unit_id=9)
+    assert slave.data_points == 8
+    assert slave.snapshot()["holding_registers"] == [0, 5, 6, 7, 0, 0, 0, 0]
+    assert 9 in context
+    assert 1 not in context
+    slave.write_table("holding_registers", 7, [1])
+
+    slave.reconfigure(data_points=2)
+    assert slave.snapshot()["holding_registers"] == [0, 5]
+    with pytest.raises(ValueError):
+        slave.write_table("holding_registers", 2, [1])
+    with pytest.raises(ValueError):
+        slave.reconfigure(unit_id=0)
+
+
+def test_reconfigure_restarts_serial_server_without_backoff(
+    fake_server: _FakeSerialServer,
+) -> None:
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        reconnect_delay=5.0,
+        reconnect_delay_max=5.0,
+        poll_interval=0.01,
+    )
+    thread = _start(slave)
+    _wait_for(lambda: slave.serial_status()["connected"])
+
+    started = time.monotonic()
+    slave.reconfigure(config=SerialConnectionConfig(port="loop://", baudrate=19200))
+    _wait_for(lambda: fake_server.calls == 2)
+    assert time.monotonic() - started < 1.0
+    _wait_for(lambda: slave.serial_status()["connected"])
+    status = slave.serial_status()
+    assert status["reconnects"] == 0
+    assert status["downtimeSeconds"] > 0
+    assert slave.config.baudrate == 19200
+
+    slave.stop()
+    thread.join(timeout=1)
+
+
+def test_failed_reopen_after_reconfigure_counts_as_outage(
+    fake_server: _FakeSerialServer,
+) -> None:
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        reconnect_delay=0.05,
+        reconnect_delay_max=0.05,
+        poll_interval=0.01,
+    )
+    thread = _start(slave)
+    _wait_for(lambda: slave.serial_status()["connected"])
+
+    fake_server.failures = 2
+    slave.reconfigure(config=SerialConnectionConfig(port="loop://", baudrate=19200))
+    _wait_for(lambda: slave.serial_status()["lastError"] == "port gone")
+    assert not slave.serial_status()["connected"]
+
+    _wait_for(lambda: slave.serial_status()["connected"])
+    status = slave.serial_status()
+    assert status["reconnects"] == 1
+    assert status["downtimeSeconds"] >= 0.05
+
+    slave.stop()
+    thread.join(timeout=1)
+
+
+def test_reload_settings_keeps_command_line_values(
+    fake_server: _FakeSerialServer, tmp_path: Path
+) -> None:
+    from sbc_vpc.__main__ import reload_settings
+
+    path = tmp_path / "sbc.json"
+    path.write_text(json.dumps({"unit_id": 7, "data_points": 16, "baudrate": 19200}))
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://", baudrate=9600),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+        unit_id=2,
+    )
+
+    argv = ["--config", str(path), "--port", "loop://", "--unit-id", "2"]
+    argv += ["--baudrate", "9600"]
+
+    applied = reload_settings(slave, str(path), argv)
+
+    assert applied["unitId"] == 2
+    assert applied["dataPoints"] == 16
+    assert slave.config.baudrate == 9600
+
+
+def test_reload_settings_reverts_keys_removed_from_file(
+    fake_server: _FakeSerialServer, tmp_path: Path
+) -> None:
+    from sbc_vpc.__main__ import reload_settings
+
+    path = tmp_path / "sbc.json"
+    path.write_text(json.dumps({"data_points": 16, "parity": "E"}))
+    slave = ModbusSlave(
+        config=SerialConnectionConfig(port="loop://"),
+        request_logger=DeltaRequestLogger(),
+        data_points=4,
+    )
+    argv = ["--config", str(path), "--port", "loop://", "--data-points", "8"]
+
+    reload_settings(slave, str(path), argv)
+    assert slave.data_points == 8
+    assert slave.config.parity == "E"
+
+    path.write_text(json.dumps({"unit_id": 3}))
+    reload_settings(slave, str(path), argv)
+    assert slave.data_points == 8
+    assert slave.config.parity == "N"
+    assert slave.unit_id == 3
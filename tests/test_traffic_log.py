@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("pymodbus")
+
+from sbc_vpc.modbus.traffic import JsonlTrafficLogger, TrafficFilter
+
+
+def _read_lines(path: Path) -> list[dict[str, object]]:
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_jsonl_logger_buffers_until_flush(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(path, flush_interval=0, clock=lambda: 100.0)
+
+    logger.log_read("holding_registers", 4, 2)
+    logger.log_write("coils", 1, [1, 0])
+    assert path.read_bytes() == b""
+
+    logger.close()
+    assert _read_lines(path) == [
+        {
+            "ts": 100.0,
+            "op": "read",
+            "table": "holding_registers",
+            "address": 4,
+            "count": 2,
+        },
+        {
+            "ts": 100.0,
+            "op": "write",
+            "table": "coils",
+            "address": 1,
+            "count": 2,
+            "values": [1, 0],
+        },
+    ]
+
+
+def test_jsonl_logger_applies_filter(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(
+        path,
+        flush_interval=0,
+        traffic_filter=TrafficFilter(
+            tables=frozenset({"holding_registers"}),
+            operations=frozenset({"write"}),
+            address_min=10,
+            address_max=19,
+        ),
+    )
+
+    logger.log_write("holding_registers", 8, [1, 2, 3])
+    logger.log_write("holding_registers", 20, [4])
+    logger.log_write("coils", 12, [1])
+    logger.log_read("holding_registers", 12, 1)
+    logger.close()
+
+    records = _read_lines(path)
+    assert [(r["table"], r["address"]) for r in records] == [
+        ("holding_registers", 8)
+    ]
+
+
+def test_jsonl_logger_rotates_and_compresses(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(
+        path, buffer_size=1, flush_interval=0, max_bytes=200, backup_count=2
+    )
+
+    for address in range(20):
+        logger.log_read("input_registers", address, 1)
+        logger.flush()
+    logger.close()
+
+    backups = sorted(tmp_path.glob("traffic.jsonl.*"))
+    assert 1 <= len(backups) <= 2
+    assert all(item.suffix == ".gz" for item in backups)
+    with gzip.open(backups[0], "rt") as handle:
+        first = json.loads(handle.readline())
+    assert first["op"] == "read"
+    assert path.stat().st_size <= 200
+
+
+def test_jsonl_logger_survives_failed_rotation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(path, buffer_size=1, flush_interval=0, max_bytes=100)
+    logger.log_read("coils", 0, 1)
+    logger.flush()
+
+    real_open = open
+
+    def failing_open(file, *args, **kwargs):
+        if Path(file) == path:
+            raise OSError(28, "No space left on device")
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", failing_open)
+    for address in range(10):
+        logger.log_read("coils", address, 1)
+        logger.flush()
+    monkeypatch.setattr("builtins.open", real_open)
+
+    logger.log_write("coils", 5, [1])
+    logger.close()
+    assert _read_lines(path)[-1]["address"] == 5
+
+
+def test_jsonl_logger_survives_failed_rename(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(path, buffer_size=1, flush_interval=0, max_bytes=100)
+
+    def failing_replace(src, dst):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr("os.replace", failing_replace)
+    for address in range(10):
+        logger.log_read("coils", address, 1)
+        logger.flush()
+    logger.close()
+    assert len(_read_lines(path)) == 10
+
+
+def test_jsonl_logger_slow_disk_does_not_block_requests(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(path, buffer_size=1, flush_interval=0)
+    stream = logger._stream
+    assert stream is not None
+    real_write = stream.write
+    write_started = threading.Event()
+
+    def slow_write(data: bytes) -> int:
+        write_started.set()
+        time.sleep(0.5)
+        return real_write(data)
+
+    logger._stream = SimpleNamespace(
+        write=slow_write, flush=stream.flush, close=stream.close
+    )
+    logger.log_read("coils", 0, 1)
+    assert write_started.wait(1.0)
+
+    started = time.monotonic()
+    for address in range(1, 50):
+        logger.log_read("coils", address, 1)
+    assert time.monotonic() - started < 0.1
+
+    logger.close()
+    assert [r["address"] for r in _read_lines(path)] == list(range(50))
+
+
+def test_prune_keeps_segments_waiting_for_compression(tmp_path: Path) -> None:
+    path = tmp_path / "traffic.jsonl"
+    logger = JsonlTrafficLogger(path, flush_interval=0, backup_count=1)
+    pending = tmp_path / "traffic.jsonl.20240101-000002"
+    pending.write_text("{}\n")
+    for name in ("traffic.jsonl.20240101-000000.gz", "traffic.jsonl.20240101-000001.gz"):
+        with gzip.open(tmp_path / name, "wt") as handle:
+            handle.write("{}\n")
+
+    logger._prune_backups()
+    logger.close()
+
+    assert pending.exists()
+    assert len(list(tmp_path.glob("traffic.jsonl.*.gz"))) == 1
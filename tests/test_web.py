@@ -23,13 +23,22 @@ class DummySlave:
         self._state: dict[str, list[int]] = {
             name: [0] * data_points for name in self._tables
         }
+        self.snapshot_calls: list[tuple[str, ...]] = []
 
     @property
     def tables(self) -> tuple[str, ...]:
         return self._tables
 
-    def snapshot(self) -> dict[str, list[int]]:
-        return {name: list(values) for name, values in self._state.items()}
+    def snapshot(
+        self,
+        start: int = 0,
+        count: int | None = None,
+        tables: list[str] | tuple[str, ...] | None = None,
+    ) -> dict[str, list[int]]:
+        self.snapshot_calls.append(tuple(self._state if tables is None else tables))
+        stop = self.data_points if count is None else start + count
+        names = self._state if tables is None else tables
+        return {name: self._state[name][start:stop] for name in names}
 
     def write_table(self, table: str, address: int, values: list[int]) -> None:
         if table not in self._state:
@@ -41,6 +50,15 @@ class DummySlave:
         for offset, value in enumerate(values):
             self._state[table][address + offset] = value
 
+    def serial_status(self) -> dict[str, object]:
+        return {
+            "port": "dummy",
+            "connected": True,
+            "reconnects": 0,
+            "downtimeSeconds": 0.0,
+            "lastError": None,
+        }
+
 
 @pytest.fixture()
 def web_server() -> WebUIServer:
@@ -100,3 +118,80 @@ def test_web_ui_rejects_invalid_payload(web_server: WebUIServer) -> None:
         urllib.request.urlopen(bad_request)
 
     assert exc_info.value.code == 400
+
+
+def test_web_ui_state_window(web_server: WebUIServer) -> None:
+    host, port = web_server.server_address
+    web_server.slave.write_table("coils", 3, [1, 1])
+
+    url = f"http://{host}:{port}/api/state?tables=coils&offset=2&limit=3"
+    with urllib.request.urlopen(url) as response:
+        payload = json.load(response)
+
+    assert payload["offset"] == 2
+    assert payload["dataPoints"] == 8
+    assert payload["tables"] == {"coils": [0, 1, 1]}
+
+    url_tail = f"http://{host}:{port}/api/state?offset=6&limit=100"
+    with urllib.request.urlopen(url_tail) as response:
+        payload_tail = json.load(response)
+    assert payload_tail["tables"]["holding_registers"] == [0, 0]
+
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(f"http://{host}:{port}/api/state?tables=bogus")
+    assert exc_info.value.code == 400
+
+
+def test_web_ui_state_per_table_windows(web_server: WebUIServer) -> None:
+    host, port = web_server.server_address
+    slave = web_server.slave
+    slave.write_table("coils", 6, [1])
+    slave.write_table("holding_registers", 0, [9])
+    slave.snapshot_calls.clear()
+
+    url = f"http://{host}:{port}/api/state?coils=5:10&holding_registers=0:2"
+    with urllib.request.urlopen(url) as response:
+        payload = json.load(response)
+
+    assert payload["tables"] == {"coils": [0, 1, 0], "holding_registers": [9, 0]}
+    assert payload["offsets"] == {"coils": 5, "holding_registers": 0}
+    assert slave.snapshot_calls == [("coils",), ("holding_registers",)]
+
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(f"http://{host}:{port}/api/state?coils=x:1")
+    assert exc_info.value.code == 400
+
+
+def test_web_ui_reload_endpoint() -> None:
+    calls: list[int] = []
+
+    def reload() -> dict[str, object]:
+        calls.append(1)
+        if len(calls) > 1:
+            raise ValueError("bad config")
+        return {"dataPoints": 8, "unitId": 2}
+
+    server = WebUIServer(slave=DummySlave(), host="127.0.0.1", port=0, reload=reload)
+    thread = server.start_in_thread()
+    host, port = server.server_address
+    url = f"http://{host}:{port}/api/reload"
+    try:
+        with urllib.request.urlopen(urllib.request.Request(url, data=b"")) as response:
+            result = json.load(response)
+        assert result == {"status": "ok", "config": {"dataPoints": 8, "unitId": 2}}
+
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(urllib.request.Request(url, data=b""))
+        assert exc_info.value.code == 400
+    finally:
+        server.shutdown()
+        thread.join(timeout=1)
+
+
+def test_web_ui_reload_requires_config(web_server: WebUIServer) -> None:
+    host, port = web_server.server_address
+    request = urllib.request.Request(f"http://{host}:{port}/api/reload", data=b"")
+
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        urllib.request.urlopen(request)
+    assert exc_info.value.code == 404
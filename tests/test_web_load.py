@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("pymodbus")
+
+from benchmarks.web_load import InMemorySlave, modbus_crc, run_http_load
+from sbc_vpc.web import WebUIServer
+
+
+def test_modbus_crc_matches_reference_frame() -> None:
+    assert modbus_crc(bytes.fromhex("010300000001")) == bytes.fromhex("840a")
+
+
+@pytest.mark.parametrize("window", [0, 4])
+def test_http_load_reuses_connections(window: int) -> None:
+    server = WebUIServer(slave=InMemorySlave(16), host="127.0.0.1", port=0)
+    thread = server.start_in_thread()
+    try:
+        host, port = server.server_address
+        result = run_http_load(
+            host,
+            port,
+            concurrency=3,
+            duration=0.3,
+            data_points=16,
+            write_ratio=0.5,
+            window=window,
+        )
+    finally:
+        server.shutdown()
+        thread.join(timeout=1)
+
+    assert result.connections == 3
+    assert result.throughput > 0
+    for summary in result.endpoints.values():
+        assert summary.count > 0
+        assert summary.errors == 0